@@ -12,19 +12,28 @@ PnL chart: cumulative realized PnL only.
 """
 
 import glob
+import io
 import json
 import os
 import time
 from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
-import pytz
-from flask import Flask, render_template_string
+from numba import njit
+from flask import Flask
+from jinja2.utils import htmlsafe_json_dumps
 
 app = Flask(__name__)
 
 CSV_FILE      = "production_log_v5.csv"
 START_BALANCE = 1000.0
+DATA_TTL_SEC  = 2.5   # Requests inside this window share one parse of the log
+LOG_ROWS      = 20    # Activity log length
+LOG_SCAN_ROWS = 500   # Initial tail window searched for activity-log events
+TS_FORMAT     = "%Y-%m-%d %H:%M:%S.%f"   # As written by StrategyController.log
+CENTRAL       = ZoneInfo("America/Chicago")
 
 EVENT_COLORS = {
     "PAPER_BUY":       "#00e676",
@@ -36,9 +45,15 @@ EVENT_COLORS = {
     "SYSTEM":          "#888",
 }
 
+# Exact match first; prefixes keep EVENT_COLORS order so SETTLE_VERIFIED wins over SETTLE
+_EVENT_PREFIXES = tuple(EVENT_COLORS.items())
+
 def _event_color(event: str) -> str:
-    for k, c in EVENT_COLORS.items():
-        if k in event:
+    c = EVENT_COLORS.get(event)
+    if c:
+        return c
+    for k, c in _EVENT_PREFIXES:
+        if event.startswith(k):
             return c
     return "#888"
 
@@ -217,9 +232,9 @@ HTML_TEMPLATE = """
 </div>
 
 <script>
-const allLabels     = {{ chart_labels | tojson }};
-const allData       = {{ chart_data | tojson }};
-const allTimestamps = {{ chart_timestamps | tojson }};
+const allLabels     = {{ chart_labels_json | safe }};
+const allData       = {{ chart_data_json | safe }};
+const allTimestamps = {{ chart_timestamps_json | safe }};
 const ctx = document.getElementById('pnlChart').getContext('2d');
 let chart;
 
@@ -288,6 +303,9 @@ buildChart(allLabels, allData);
 </html>
 """
 
+# Compiled once at import — render_template_string re-parses the source on every call
+_TEMPLATE = app.jinja_env.from_string(HTML_TEMPLATE)
+
 
 def safe_float(val, default=0.0):
     try:    return float(val)
@@ -297,16 +315,125 @@ def safe_int(val, default=0):
     try:    return int(val)
     except: return default
 
+def _num(s, fill=0.0):
+    """Vectorized safe_float for a whole column."""
+    return pd.to_numeric(s, errors="coerce").fillna(fill)
+
+
+# Integer event codes fed to _settle_agg; anything else is 0
+EV_PAYOUT, EV_SETTLE, EV_PAPER_BUY, EV_LIVE_BUY = 1, 2, 3, 4
+_EVENT_CODES = {"PAYOUT": EV_PAYOUT, "SETTLE": EV_SETTLE,
+                "PAPER_BUY": EV_PAPER_BUY, "LIVE_BUY": EV_LIVE_BUY}
+
+def _event_codes(ev):
+    """Map a categorical event column to int8 codes via its (few) categories."""
+    lut = np.array([_EVENT_CODES.get(c, 0) for c in ev.cat.categories] + [0], dtype=np.int8)
+    return lut[ev.cat.codes.to_numpy()]   # NaN has code -1 -> trailing 0
+
+@njit(cache=True)
+def _settle_agg(code, pnl):
+    """One pass over the log: running realized PnL, win/loss counts, mean PnL per settle."""
+    cum    = np.empty_like(pnl)
+    s      = 0.0
+    wins   = 0
+    losses = 0
+    for i in range(code.size):
+        c = code[i]
+        if c == EV_PAYOUT or c == EV_SETTLE:
+            s += pnl[i]
+            if c == EV_PAYOUT:
+                wins += 1
+            else:
+                losses += 1
+        cum[i] = s
+    n = wins + losses
+    return cum, wins, losses, (s / n if n else 0.0)
+
+
+# Only the log columns the dashboard reads; everything else is skipped by the parser
+_COLS = frozenset([
+    "timestamp", "event", "mode", "ticker", "msg",
+    "pnl_this_trade", "bankroll", "entry_price", "spread", "signal_age_min",
+    "ob_stale", "signal_birth_time", "ut_signal", "ut_stop", "ut_atr",
+    "raw_yes_bid", "raw_no_bid", "ask_yes", "ask_no", "yes_liq", "no_liq",
+    "time_left", "strike", "obi",
+])
+_DTYPES = {
+    "event": "category", "mode": "category",
+    **{c: "float64" for c in (
+        "pnl_this_trade", "bankroll", "entry_price", "spread", "signal_age_min",
+        "ob_stale", "signal_birth_time", "ut_stop", "ut_atr",
+        "raw_yes_bid", "raw_no_bid", "ask_yes", "ask_no", "yes_liq", "no_liq",
+        "time_left", "strike", "obi",
+    )},
+}
+
+_LOG_STATE = {}   # path -> {"ino": int, "size": bytes consumed, "names": header, "df": DataFrame}
+
+def _parse_chunk(buf, names=None):
+    """Parse CSV bytes; timestamps are converted here so each row is parsed once."""
+    kw = dict(usecols=lambda c: c in _COLS, dtype=_DTYPES, engine="c")
+    if names is None:
+        chunk = pd.read_csv(io.BytesIO(buf), **kw)
+    else:
+        chunk = pd.read_csv(io.BytesIO(buf), header=None, names=names, **kw)
+    if "timestamp" in chunk.columns:
+        chunk["timestamp"] = pd.to_datetime(chunk["timestamp"], utc=True, format=TS_FORMAT)
+    return chunk
+
+def _read_log(path):
+    """
+    Return the parsed log at `path`, reading only the bytes appended since the
+    previous call. A replaced or truncated file is re-read in full. Only complete
+    lines are consumed, so a row the bot is still writing is picked up next time.
+    """
+    st    = os.stat(path)
+    state = _LOG_STATE.get(path)
+    if state and (state["ino"] != st.st_ino or st.st_size < state["size"]):
+        state = None
+    if state and st.st_size == state["size"]:
+        return state["df"]
+
+    with open(path, "rb") as f:
+        if state:
+            f.seek(state["size"])
+        buf = f.read()
+    end = buf.rfind(b"\n") + 1
+    if end == 0:
+        return state["df"] if state else None
+
+    if state:
+        names = state["names"]
+        new   = _parse_chunk(buf[:end], names=names)
+        df    = new if state["df"].empty else pd.concat([state["df"], new], ignore_index=True)
+        end  += state["size"]
+    else:
+        names = pd.read_csv(io.BytesIO(buf[:end]), nrows=0).columns.tolist()
+        df    = _parse_chunk(buf[:end])
+
+    _LOG_STATE[path] = {"ino": st.st_ino, "size": end, "names": names, "df": df}
+    return df
+
+
+_CHART_CACHE = {"key": None, "last": 0.0, "labels": "[]", "data": "[]", "ts": "[]"}
+
+def _tojson(obj):
+    """Same output as the template's |tojson filter, for pre-encoding outside Jinja."""
+    return htmlsafe_json_dumps(obj, dumps=app.json.dumps)
+
 
 def get_data():
     files = glob.glob(f"{CSV_FILE}*")
+    for p in set(_LOG_STATE) - set(files):
+        del _LOG_STATE[p]
+
     df_list = []
     for p in files:
         if not os.path.exists(p):
             continue
         try:
-            tmp = pd.read_csv(p)
-            if "timestamp" in tmp.columns and not tmp.empty:
+            tmp = _read_log(p)
+            if tmp is not None and "timestamp" in tmp.columns and not tmp.empty:
                 df_list.append(tmp)
         except Exception:
             pass  # skip empty, corrupt, or mid-write files
@@ -315,51 +442,67 @@ def get_data():
         return None
 
     try:
-        df = pd.concat(df_list, ignore_index=True)
+        # One log file is the common case — skip the concat copy entirely
+        df = df_list[0] if len(df_list) == 1 else pd.concat(df_list, ignore_index=True)
 
         # Guard: require timestamp column and at least one row
         if "timestamp" not in df.columns or df.empty:
             return None
 
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
-        df = df.sort_values("timestamp").reset_index(drop=True)
+        df = df.sort_values("timestamp", ignore_index=True)
         last    = df.iloc[-1]
-        central = pytz.timezone("US/Central")
+        ts_ct   = df["timestamp"].dt.tz_convert(CENTRAL)
 
-        # ── PnL chart: cumulative sum of pnl_this_trade on settled rows only ──
-        settled = df[df["event"].isin(["PAYOUT", "SETTLE"])].copy()
-        if "pnl_this_trade" in settled.columns and not settled.empty:
-            settled["cum_pnl"] = settled["pnl_this_trade"].apply(safe_float).cumsum()
-        else:
-            settled["cum_pnl"] = settled["bankroll"].apply(safe_float) - START_BALANCE if "bankroll" in settled.columns else 0
+        # Appended chunks may concat back to object dtype — one cast, then int compares
+        ev   = df["event"].astype("category")
+        code = _event_codes(ev)
 
-        chart_labels     = settled["timestamp"].dt.tz_convert(central).dt.strftime("%H:%M").tolist()
-        chart_data       = settled["cum_pnl"].round(4).tolist()
-        chart_timestamps = settled["timestamp"].dt.strftime("%Y-%m-%dT%H:%M:%SZ").tolist()
+        has_pnl = "pnl_this_trade" in df.columns
+        pnl_all = _num(df["pnl_this_trade"]).to_numpy(np.float64) if has_pnl else np.zeros(len(df))
+        cum_pnl, wins, losses, avg_pnl = _settle_agg(code, pnl_all)
 
-        # Anchor at zero
-        if chart_data:
-            chart_labels     = ["start"] + chart_labels
-            chart_data       = [0.0]     + chart_data
-            chart_timestamps = [chart_timestamps[0]] + chart_timestamps
-
-        realized_balance = START_BALANCE + (chart_data[-1] if len(chart_data) > 1 else 0.0)
+        # ── PnL chart: cumulative sum of pnl_this_trade on settled rows only ──
+        is_settled = (code == EV_PAYOUT) | (code == EV_SETTLE)
+        settled    = df[is_settled].copy()
+        if has_pnl and not settled.empty:
+            settled["cum_pnl"] = cum_pnl[is_settled]
+        else:
+            settled["cum_pnl"] = _num(settled["bankroll"]) - START_BALANCE if "bankroll" in settled.columns else 0
+
+        # Settled rows only grow between refreshes — rebuild the chart JSON only when they do
+        chart_key = (len(settled), settled["timestamp"].iloc[-1] if len(settled) else None)
+        if chart_key != _CHART_CACHE["key"]:
+            chart_labels     = ts_ct.loc[settled.index].dt.strftime("%H:%M").tolist()
+            chart_data       = settled["cum_pnl"].round(4).tolist()
+            chart_timestamps = settled["timestamp"].dt.strftime("%Y-%m-%dT%H:%M:%SZ").tolist()
+
+            # Anchor at zero
+            if chart_data:
+                chart_labels     = ["start"] + chart_labels
+                chart_data       = [0.0]     + chart_data
+                chart_timestamps = [chart_timestamps[0]] + chart_timestamps
+
+            _CHART_CACHE.update(
+                key=chart_key,
+                last=chart_data[-1] if len(chart_data) > 1 else 0.0,
+                labels=_tojson(chart_labels),
+                data=_tojson(chart_data),
+                ts=_tojson(chart_timestamps),
+            )
+
+        realized_balance = START_BALANCE + _CHART_CACHE["last"]
         pnl              = realized_balance - START_BALANCE
 
-        wins   = len(df[df["event"] == "PAYOUT"])
-        losses = len(df[df["event"] == "SETTLE"])
         total  = wins + losses
 
-        buy_rows       = df[df["event"].isin(["PAPER_BUY", "LIVE_BUY"])]
-        avg_entry      = round(buy_rows["entry_price"].apply(safe_float).mean(), 1)      if len(buy_rows) else 0
-        avg_spread     = round(buy_rows["spread"].apply(safe_float).mean(), 1)           if len(buy_rows) and "spread" in buy_rows.columns else 0
-        avg_signal_age = round(buy_rows["signal_age_min"].apply(safe_float).mean(), 1)   if len(buy_rows) and "signal_age_min" in buy_rows.columns else 0
-        pnl_series     = settled["pnl_this_trade"].apply(safe_float) if "pnl_this_trade" in settled.columns and not settled.empty else pd.Series(dtype=float)
-        avg_pnl        = pnl_series.mean() if len(pnl_series) else 0.0
+        buy_rows       = df[code >= EV_PAPER_BUY]
+        avg_entry      = round(_num(buy_rows["entry_price"]).mean(), 1)      if len(buy_rows) else 0
+        avg_spread     = round(_num(buy_rows["spread"]).mean(), 1)           if len(buy_rows) and "spread" in buy_rows.columns else 0
+        avg_signal_age = round(_num(buy_rows["signal_age_min"]).mean(), 1)   if len(buy_rows) and "signal_age_min" in buy_rows.columns else 0
 
         now_utc   = pd.Timestamp.now("UTC")
         is_active = (now_utc - last["timestamp"]).total_seconds() < 120
-        ob_stale  = bool(df.tail(5)["ob_stale"].astype(int).sum() >= 3) if "ob_stale" in df.columns else False
+        ob_stale  = bool(_num(df["ob_stale"].tail(5)).sum() >= 3) if "ob_stale" in df.columns else False
         mode_str  = str(last.get("mode", "PAPER"))
 
         birth_ts   = safe_float(last.get("signal_birth_time", 0))
@@ -373,18 +516,31 @@ def get_data():
         yes_liq  = safe_int(lm.get("yes_liq", 0))
         no_liq   = safe_int(lm.get("no_liq",  0))
 
-        log_df = df[~df["event"].isin(["HRTBT", "SKIP"])].tail(20).iloc[::-1]
-        logs   = []
-        for _, r in log_df.iterrows():
-            ev = str(r.get("event", ""))
-            logs.append({
-                "time":  r["timestamp"].astimezone(central).strftime("%H:%M:%S"),
+        # Search a tail window for the latest events, widening it only if heartbeats
+        # crowd out LOG_ROWS real events — avoids masking the whole history each refresh
+        window = LOG_SCAN_ROWS
+        while True:
+            recent = ev.iloc[-window:]
+            hits   = recent.index[~recent.isin(("HRTBT", "SKIP"))]
+            if len(hits) >= LOG_ROWS or window >= len(df):
+                break
+            window *= 4
+        log_df = df.loc[hits[-LOG_ROWS:][::-1]]
+        log_t  = ts_ct.loc[log_df.index].dt.strftime("%H:%M:%S").tolist()
+        log_ev = [str(v) for v in log_df["event"].tolist()]
+        log_m  = [str(v) for v in log_df["msg"].tolist()] if "msg" in log_df.columns else [""] * len(log_ev)
+        colors = {ev: _event_color(ev) for ev in set(log_ev)}
+        logs   = [
+            {
+                "time":  t,
                 "event": ev.replace("PAPER_", "").replace("LIVE_", ""),
-                "color": _event_color(ev),
-                "msg":   str(r.get("msg", "")),
-            })
+                "color": colors[ev],
+                "msg":   m,
+            }
+            for t, ev, m in zip(log_t, log_ev, log_m)
+        ]
 
-        last_ct   = last["timestamp"].astimezone(central)
+        last_ct   = ts_ct.iloc[-1]
 
         return dict(
             last_update=last_ct.strftime("%H:%M:%S"),
@@ -405,9 +561,9 @@ def get_data():
             yes_bid=yes_bid, no_bid=no_bid,
             yes_ask=yes_ask, no_ask=no_ask,
             yes_liq=yes_liq, no_liq=no_liq,
-            chart_labels=chart_labels,
-            chart_data=chart_data,
-            chart_timestamps=chart_timestamps,
+            chart_labels_json=_CHART_CACHE["labels"],
+            chart_data_json=_CHART_CACHE["data"],
+            chart_timestamps_json=_CHART_CACHE["ts"],
             logs=logs,
         )
 
@@ -417,17 +573,61 @@ def get_data():
         return None
 
 
+_CACHE = {"t": 0.0, "mtime": None, "v": None}
+
+def _cached_get_data(ttl=DATA_TTL_SEC):
+    """get_data() memoized for `ttl` seconds, invalidated early if the log changes."""
+    try:    mtime = os.path.getmtime(CSV_FILE)
+    except OSError: mtime = None
+    now = time.monotonic()
+    if _CACHE["v"] is not None and now - _CACHE["t"] < ttl and mtime == _CACHE["mtime"]:
+        return _CACHE["v"]
+    _CACHE["v"]     = get_data()
+    _CACHE["t"]     = now
+    _CACHE["mtime"] = mtime
+    return _CACHE["v"]
+
+
+def _tail_timestamp(path):
+    """Timestamp field of the last complete row in `path`, read from the file's end."""
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        size = f.tell()
+        blk  = min(4096, size)
+        f.seek(size - blk)
+        buf  = f.read()
+    lines = buf.splitlines()
+    if not buf.endswith(b"\n"):
+        lines = lines[:-1]   # row still being written
+    if not lines:
+        return None
+    return lines[-1].split(b",", 1)[0].decode()
+
+
+def get_last_update():
+    """Central-time HH:MM:SS of the newest log row without parsing the log."""
+    files = glob.glob(f"{CSV_FILE}*")
+    if not files:
+        return None
+    try:
+        raw = _tail_timestamp(max(files, key=os.path.getmtime))
+        ts  = datetime.strptime(raw, TS_FORMAT).replace(tzinfo=timezone.utc)
+    except (OSError, ValueError, TypeError):
+        return None   # missing file, header-only log, or partial row
+    return ts.astimezone(CENTRAL).strftime("%H:%M:%S")
+
+
 @app.route("/")
 def home():
-    data = get_data()
-    return render_template_string(HTML_TEMPLATE, **data) if data else "Waiting for bot data..."
+    data = _cached_get_data()
+    return _TEMPLATE.render(**data) if data else "Waiting for bot data..."
 
 @app.route("/health")
 def health():
-    data = get_data()
-    if not data:
+    last_update = get_last_update()
+    if not last_update:
         return {"status": "starting"}, 503
-    return {"status": "ok", "last_update": data["last_update"]}
+    return {"status": "ok", "last_update": last_update}
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000, debug=True)
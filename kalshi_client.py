@@ -1,6 +1,5 @@
 import asyncio
 import base64
-import json
 import time
 import uuid
 import os
@@ -10,19 +9,27 @@ from pathlib import Path
 from typing import Dict, Optional, Any
 from urllib.parse import urlencode
 
+import aiohttp
 import httpx
+import orjson
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
+from sortedcontainers import SortedDict
 
 class KalshiClient:
     """
     Standalone Kalshi Client (No external dependencies).
     Place this file in the same directory as your bot.
     """
+    # Signing primitives are stateless — build once, not per request
+    _SHA = hashes.SHA256()
+    _PSS = padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=hashes.SHA256.digest_size)
+
     def __init__(self, email=None, password=None, api_key=None, private_key_path=None):
         # 1. LOAD CREDENTIALS (Prioritize arguments, then Environment Variables)
         self.api_key = api_key or os.getenv("KALSHI_API_KEY")
         self.base_url = "https://api.elections.kalshi.com"  # V2 API URL
+        self.ws_url = "wss://api.elections.kalshi.com/trade-api/ws/v2"
         self.private_key_path = private_key_path or os.getenv("KALSHI_PRIVATE_KEY_PATH")
         
         # 2. LOAD KEY
@@ -31,8 +38,17 @@ class KalshiClient:
             
         self.private_key = self._load_private_key(self.private_key_path)
         
-        # 3. HTTP CLIENT
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # 3. HTTP CLIENT — one pooled HTTP/2 connection set, static auth headers baked in
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0),
+            headers={"Content-Type": "application/json", "KALSHI-ACCESS-KEY": self.api_key},
+        )
+        # Monotonic deadline set on 429 — every request waits it out before sending
+        self._rl_until = 0.0
+        # (endpoint, params) -> in-flight GET task, shared by concurrent identical calls
+        self._inflight: Dict[tuple, asyncio.Task] = {}
         print("✅ Kalshi Client Initialized (Standalone Mode)")
 
     def _load_private_key(self, path_str):
@@ -45,46 +61,72 @@ class KalshiClient:
                 password=None
             )
 
-    def _sign_request(self, timestamp: str, method: str, path: str) -> str:
-        msg = timestamp + method.upper() + path
-        signature = self.private_key.sign(
-            msg.encode('utf-8'),
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=hashes.SHA256().digest_size
-            ),
-            hashes.SHA256()
-        )
+    def _sign_request(self, timestamp: bytes, method: bytes, path: bytes) -> str:
+        """Sign timestamp + METHOD + path; callers pass pre-encoded bytes."""
+        signature = self.private_key.sign(timestamp + method + path, self._PSS, self._SHA)
         return base64.b64encode(signature).decode('utf-8')
 
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Capped exponential backoff with full jitter."""
+        return min(5.0, random.uniform(0, 0.5 * (2 ** attempt)))
+
     async def _request(self, method, endpoint, params=None, data=None):
-        url = f"{self.base_url}{endpoint}"
-        ts = str(int(time.time() * 1000))
-        
-        headers = {
-            "Content-Type": "application/json",
-            "KALSHI-ACCESS-KEY": self.api_key,
-            "KALSHI-ACCESS-TIMESTAMP": ts,
-            "KALSHI-ACCESS-SIGNATURE": self._sign_request(ts, method, endpoint)
-        }
-        
-        if params:
-            url += "?" + urlencode(params)
-            
-        json_body = json.dumps(data) if data else None
+        """
+        Signed request with retries. Concurrent identical GETs share one round
+        trip; POST/DELETE are never coalesced.
+        """
+        if method != "GET":
+            return await self._send(method, endpoint, params, data)
+
+        key  = (endpoint, tuple(sorted((params or {}).items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(method, endpoint, params, data))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        # shield: one caller being cancelled must not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _send(self, method, endpoint, params=None, data=None):
+        # Encoded once; only the timestamp and signature change between retries
+        query        = ("?" + urlencode(params)) if params else ""
+        url          = f"{self.base_url}{endpoint}{query}"
+        json_body    = orjson.dumps(data) if data else None
+        method_bytes = method.upper().encode()
+        path_bytes   = endpoint.encode()
 
         for attempt in range(5):
+            wait = self._rl_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            # Re-sign each attempt so a retry never sends a stale timestamp
+            ts = str(time.time_ns() // 1_000_000)
+            headers = {
+                "KALSHI-ACCESS-TIMESTAMP": ts,
+                "KALSHI-ACCESS-SIGNATURE": self._sign_request(ts.encode(), method_bytes, path_bytes),
+            }
             try:
                 resp = await self.client.request(method, url, headers=headers, content=json_body)
+            except httpx.TransportError as e:   # network errors and timeouts — retry
+                err = e
+            else:
                 if resp.status_code == 429:
-                    await asyncio.sleep(0.5 * (2 ** attempt) + random.random())
+                    # Shared cooldown: concurrent orderbook/order calls stop firing too
+                    self._rl_until = max(self._rl_until, time.monotonic() + self._backoff(attempt))
                     continue
-                resp.raise_for_status()
-                return resp.json()
-            except Exception as e:
-                if attempt == 4:
-                    print(f"❌ API Error: {e}")
-                await asyncio.sleep(0.5 * (2 ** attempt) + random.random())
+                if resp.status_code < 500:
+                    # 4xx (bad request, auth, insufficient balance) won't succeed on retry —
+                    # raise_for_status surfaces it to the caller immediately
+                    resp.raise_for_status()
+                    return orjson.loads(resp.content) if resp.content else {}
+                err = f"HTTP {resp.status_code} for {method} {endpoint}"
+
+            if attempt == 4:
+                print(f"❌ API Error: {err}")
+                break
+            await asyncio.sleep(self._backoff(attempt))
         return {}
 
     # --- PUBLIC METHODS ---
@@ -101,6 +143,84 @@ class KalshiClient:
     async def get_orderbook(self, ticker, depth=25):
         return await self._request("GET", f"/trade-api/v2/markets/{ticker}/orderbook", params={"depth": depth})
 
+    async def watch_orderbook(self, ticker, idle_timeout=0.5):
+        """
+        Streams one market's order book over the v2 WebSocket (orderbook_delta channel).
+        Yields (seq, yes, no) — the sequence number of the last applied message and two
+        SortedDicts of price -> resting size, best bid at peekitem(-1) — after the snapshot,
+        after updates, and every idle_timeout seconds while the book is quiet (same seq).
+        Raises ConnectionError on close or sequence gap; caller reconnects.
+
+        Frames are received and applied by a background reader task, so the socket keeps
+        draining while the caller works on the last yield. Updates that land meanwhile are
+        coalesced: the next yield carries the latest seq, not one yield per delta.
+        """
+        ts = str(time.time_ns() // 1_000_000)
+        headers = {
+            "KALSHI-ACCESS-KEY": self.api_key,
+            "KALSHI-ACCESS-TIMESTAMP": ts,
+            "KALSHI-ACCESS-SIGNATURE": self._sign_request(ts.encode(), b"GET", b"/trade-api/ws/v2"),
+        }
+        yes, no = SortedDict(), SortedDict()
+        seq = None
+        updated = asyncio.Event()
+
+        async def read(ws):
+            nonlocal seq
+            try:
+                while True:
+                    msg = await ws.receive()
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        raise ConnectionError(f"Kalshi WS closed ({msg.type.name})")
+
+                    m = orjson.loads(msg.data)
+                    kind = m.get("type")
+                    if kind == "orderbook_snapshot":
+                        book = m["msg"]
+                        yes.clear(); yes.update(book.get("yes") or [])
+                        no.clear();  no.update(book.get("no") or [])
+                    elif kind == "orderbook_delta":
+                        if seq is None or m["seq"] != seq + 1:
+                            raise ConnectionError(f"Kalshi WS sequence gap on {ticker}")
+                        d    = m["msg"]
+                        side = yes if d["side"] == "yes" else no
+                        size = side.get(d["price"], 0) + d["delta"]
+                        if size > 0:
+                            side[d["price"]] = size
+                        else:
+                            side.pop(d["price"], None)
+                    elif kind == "error":
+                        raise ConnectionError(f"Kalshi WS error: {m.get('msg')}")
+                    else:
+                        continue    # subscribed / ok acks
+                    seq = m.get("seq")
+                    updated.set()
+            finally:
+                updated.set()       # wake the consumer so it sees the failure
+
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(self.ws_url, headers=headers, heartbeat=10.0) as ws:
+                await ws.send_str(orjson.dumps({
+                    "id": 1, "cmd": "subscribe",
+                    "params": {"channels": ["orderbook_delta"], "market_ticker": ticker},
+                }).decode())
+
+                reader = asyncio.create_task(read(ws))
+                try:
+                    while True:
+                        try:
+                            async with asyncio.timeout(idle_timeout):
+                                await updated.wait()
+                        except TimeoutError:
+                            pass
+                        if reader.done():
+                            reader.result()     # re-raise the reader's ConnectionError
+                        updated.clear()
+                        if seq is not None:
+                            yield seq, yes, no
+                finally:
+                    reader.cancel()
+
     async def create_order(self, ticker, action, type, count, price=None, side="yes"):
         payload = {
             "action": action, "count": count, "side": side, "ticker": ticker, 
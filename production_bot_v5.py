@@ -38,22 +38,29 @@ Changelog v5.1.0:
 """
 
 import asyncio
-import collections
+import atexit
 import csv
-import json
 import logging
 import os
+import signal
+import statistics
 import sys
 import time
 from collections import deque
-from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue
 from pathlib import Path
 
+import aiohttp
+import httpx
 import numpy as np
-import pandas as pd
+import orjson
 import ccxt.pro as ccxt
 from dotenv import load_dotenv
+from numba import njit
 
 from kalshi_client import KalshiClient
 
@@ -85,6 +92,7 @@ class Config:
     MAX_STALK_POST_SIGNAL_MIN = 10.0
 
     LOG_FILE        = "production_log_v5.csv"
+    LOG_FLUSH_SEC   = 30.0    # Max age of buffered HRTBT rows; other events flush at once
     SYSTEM_LOG_FILE = "bot_v5.log"
     STATE_DIR       = "state"
     STATE_FILE      = "state/acted_birth_ts.json"   # Persisted birth-time dedup
@@ -104,14 +112,24 @@ class Config:
     SETTLEMENT_MAX_RETRIES    = 4
 
 
-def update_config_from_file():
-    if not os.path.exists("config.json"): return
+_config_mtime = None
+
+def update_config_from_file() -> bool:
+    """Apply config.json overrides. One stat per call; reloads and returns True only when the file changed."""
+    global _config_mtime
+    try: mtime = os.stat("config.json").st_mtime_ns
+    except OSError: return False
+    if mtime == _config_mtime: return False
+    _config_mtime = mtime
     try:
-        with open("config.json") as f: new = json.load(f)
+        with open("config.json", "rb") as f: new = orjson.loads(f.read())
         for key, value in new.items():
             if hasattr(Config, key):
                 setattr(Config, key, value)
-    except Exception: pass
+    except Exception:
+        _config_mtime = None   # Half-written file — retry on the next call
+        return False
+    return True
 
 def setup_logging():
     logger = logging.getLogger("kalshi_bot_v5")
@@ -119,7 +137,12 @@ def setup_logging():
     if logger.handlers: return logger
     handler = RotatingFileHandler(Config.SYSTEM_LOG_FILE, maxBytes=5_000_000, backupCount=3)
     handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
-    logger.addHandler(handler)
+    # Callers only enqueue; the listener thread does the file write and any rotation
+    queue    = SimpleQueue()
+    listener = QueueListener(queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(QueueHandler(queue))
     return logger
 
 
@@ -131,14 +154,27 @@ class RiskEngine:
     def __init__(self, start_balance: float):
         self.paper_balance = start_balance
         self.real_balance  = 0.0
-        self.pnl_history   = deque(maxlen=5000)
+        # (ts, pnl) within the last 24h, oldest first; _loss_24h is the running sum of its
+        # negative entries. No maxlen — pruning by age bounds it, and eviction would skew the sum.
+        self.pnl_history   = deque()
+        self._loss_24h     = 0.0
 
     def record_pnl(self, amount: float):
         self.pnl_history.append((time.time(), amount))
+        if amount < 0:
+            self._loss_24h += amount
 
     def rolling_24h_loss(self) -> float:
-        cutoff = time.time() - 86400
-        return sum(pnl for ts, pnl in self.pnl_history if ts > cutoff and pnl < 0)
+        """Amortized O(1): expire entries older than 24h from the running sum."""
+        cutoff  = time.time() - 86400
+        history = self.pnl_history
+        while history and history[0][0] <= cutoff:
+            _, pnl = history.popleft()
+            if pnl < 0:
+                self._loss_24h -= pnl
+        if not history:
+            self._loss_24h = 0.0   # Drop accumulated float residue
+        return self._loss_24h
 
     def calculate_qty(self, entry_price_cents: int) -> int:
         bankroll = self.paper_balance if Config.PAPER_MODE else self.real_balance
@@ -149,62 +185,144 @@ class RiskEngine:
 
 
 class SharedState:
+    """
+    Indicator output published as one immutable tuple. The writer swaps the
+    reference in a single store, so readers always see a consistent set of
+    values without a lock or an await.
+    """
     def __init__(self):
-        self.lock             = asyncio.Lock()
-        self.latest_btc       = 0.0
-        self.ut_signal        = None
-        self.ut_atr           = 0.0
-        self.ut_stop          = 0.0
-        self.signal_birth_time = 0.0
-
-    async def update_indicator(self, signal, atr, stop, btc, birth_ts):
-        async with self.lock:
-            self.latest_btc        = btc
-            self.ut_atr            = atr
-            self.ut_stop           = stop
-            self.ut_signal         = signal
-            self.signal_birth_time = birth_ts
+        # (ut_signal, ut_atr, ut_stop, latest_btc, signal_birth_time)
+        self.snapshot = (None, 0.0, 0.0, 0.0, 0.0)
+
+    def update_indicator(self, signal, atr, stop, btc, birth_ts):
+        self.snapshot = (signal, atr, stop, btc, birth_ts)
+
+    @property
+    def latest_btc(self):
+        return self.snapshot[3]
+
+
+@dataclass(slots=True)
+class TickData:
+    """
+    One Kalshi market tick, passed from kalshi_market_loop to on_tick. The loop
+    keeps one instance per session and updates it in place; on_tick copies what
+    it needs and must not hold on to it.
+    """
+    ticker:       str   = ""
+    strike:       float = 0
+    minutes_left: float = 0.0
+    raw_yes_bid:  int   = 0
+    raw_no_bid:   int   = 0
+    ask_yes:      int   = 0
+    ask_no:       int   = 0
+    yes_liq:      int   = 0
+    no_liq:       int   = 0
+    obi:          float = 0.0
+    obi_depths:   np.ndarray = None   # OBI over the best 1..OB_DEPTH levels (obi == [-1])
 
 
 # ═════════════════════════════════════════════════════════════════════════════
 # INDICATOR MATH (1:1 TRADINGVIEW)
 # ═════════════════════════════════════════════════════════════════════════════
 
-def calculate_ut_bot(df, key_value, atr_period):
-    prev_close = df['close'].shift(1)
-    tr = pd.concat([
-        df['high'] - df['low'],
-        (df['high'] - prev_close).abs(),
-        (df['low']  - prev_close).abs()
-    ], axis=1).max(axis=1)
-
-    # Wilder's RMA — matches Pine's atr()
-    atr = np.zeros(len(df))
-    atr[atr_period - 1] = tr.iloc[:atr_period].mean()
-    for i in range(atr_period, len(df)):
-        atr[i] = (tr.iloc[i] - atr[i - 1]) * (1.0 / atr_period) + atr[i - 1]
-
-    df['atr']   = atr
-    n_loss      = key_value * df['atr']
-
-    stops = np.zeros(len(df))
-    for i in range(1, len(df)):
-        if df['atr'].iloc[i] == 0: continue
-        p_stop  = stops[i - 1]
-        p_close = df['close'].iloc[i - 1]
-        c_close = df['close'].iloc[i]
-        nl      = n_loss.iloc[i]
-        if   c_close > p_stop and p_close > p_stop: stops[i] = max(p_stop, c_close - nl)
-        elif c_close < p_stop and p_close < p_stop: stops[i] = min(p_stop, c_close + nl)
-        elif c_close > p_stop:                       stops[i] = c_close - nl
-        else:                                        stops[i] = c_close + nl
-
-    df['xATRTrailingStop'] = stops
-    df['ut_signal']        = np.where(df['close'] > df['xATRTrailingStop'], 'buy', 'sell')
-    df['flipped']          = df['ut_signal'] != df['ut_signal'].shift(1)
-    df['birth_ts']         = (df['timestamp'] / 1000.0).where(df['flipped']).ffill()
-
-    return df
+@njit(cache=True)
+def _ut_bot_kernel(close, high, low, key_value, atr_period, atr, stops):
+    """
+    ATR (Wilder's RMA) and UT Bot trailing stop over float64 arrays, written
+    in place into `atr` and `stops` so callers can reuse the buffers.
+    Returns the index of the bar where the close-vs-stop side last flipped
+    (0 if it never did) — the signal's birth bar.
+    """
+    n   = close.size
+    acc = 0.0
+    for i in range(n):
+        # True range; the first bar has no previous close, so TR = high - low
+        if i == 0:
+            tr = high[0] - low[0]
+        else:
+            pc = close[i - 1]
+            tr = max(high[i] - low[i], abs(high[i] - pc), abs(low[i] - pc))
+
+        # Wilder's RMA — matches Pine's atr(); seeded with the SMA of the first period
+        if i < atr_period - 1:
+            acc   += tr
+            atr[i] = 0.0
+        elif i == atr_period - 1:
+            acc   += tr
+            atr[i] = acc / atr_period
+        else:
+            atr[i] = (tr - atr[i - 1]) * (1.0 / atr_period) + atr[i - 1]
+
+    stops[0] = 0.0
+    above    = close[0] > 0.0
+    born     = 0
+    for i in range(1, n):
+        c_close = close[i]
+        if atr[i] == 0:
+            stops[i] = 0.0
+        else:
+            p_stop  = stops[i - 1]
+            p_close = close[i - 1]
+            nl      = key_value * atr[i]
+            if   c_close > p_stop and p_close > p_stop: stops[i] = max(p_stop, c_close - nl)
+            elif c_close < p_stop and p_close < p_stop: stops[i] = min(p_stop, c_close + nl)
+            elif c_close > p_stop:                       stops[i] = c_close - nl
+            else:                                        stops[i] = c_close + nl
+        if (c_close > stops[i]) != above:
+            above = not above
+            born  = i
+    return born
+
+
+def calculate_ut_bot(df, key_value, atr_period, atr=None, stops=None):
+    """
+    Run UT Bot over a candle DataFrame without modifying it.
+
+    Returns (atr, stops, ut_signal, birth_ts): the ATR and trailing-stop arrays
+    for every row, plus the signal and birth time (seconds) of the last row —
+    the only row the strategy consumes. Pass preallocated `atr` / `stops`
+    buffers (at least len(df) long) to avoid allocating per call.
+    """
+    return _ut_bot_arrays(
+        df['timestamp'].to_numpy(np.float64),
+        df['high'].to_numpy(np.float64),
+        df['low'].to_numpy(np.float64),
+        df['close'].to_numpy(np.float64),
+        key_value, atr_period, atr, stops,
+    )
+
+
+def _ut_bot_arrays(ts, high, low, close, key_value, atr_period, atr=None, stops=None):
+    """calculate_ut_bot() on raw float64 column arrays — no DataFrame involved."""
+    n     = close.size
+    atr   = np.empty(n) if atr   is None else atr[:n]
+    stops = np.empty(n) if stops is None else stops[:n]
+    # Birth time = timestamp of the last bar where the signal flipped (bar 0 counts)
+    born = _ut_bot_kernel(close, high, low, float(key_value), int(atr_period), atr, stops)
+    return atr, stops, ("buy" if close[-1] > stops[-1] else "sell"), float(ts[born]) / 1000.0
+
+
+def _ut_bot_step(prev, ts_ms, high, low, close, key_value, atr_period):
+    """
+    Advance UT Bot by one bar — the same recurrence as _ut_bot_kernel.
+    `prev` and the return value are (atr, stop, close, above_stop, birth_ts).
+    """
+    p_atr, p_stop, p_close, p_above, p_birth = prev
+    tr  = max(high - low, abs(high - p_close), abs(low - p_close))
+    atr = (tr - p_atr) * (1.0 / atr_period) + p_atr
+
+    if atr == 0:
+        stop = 0.0
+    else:
+        nl = key_value * atr
+        if   close > p_stop and p_close > p_stop: stop = max(p_stop, close - nl)
+        elif close < p_stop and p_close < p_stop: stop = min(p_stop, close + nl)
+        elif close > p_stop:                       stop = close - nl
+        else:                                      stop = close + nl
+
+    above = close > stop
+    return atr, stop, close, above, (ts_ms / 1000.0 if above != p_above else p_birth)
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -233,6 +351,23 @@ LOG_COLUMNS = [
     "msg"
 ]
 
+# Every log ctx carries all LOG_COLUMNS keys so log() can index instead of .get().
+# timestamp/event/mode/spread/bankroll/rolling_24h_loss/ob_stale/msg are filled by log().
+_CTX_DEFAULTS = dict.fromkeys(LOG_COLUMNS, "")
+_CTX_DEFAULTS.update(
+    entry_price=0, qty=0, time_left=0.0, btc_price=0.0, strike=0,
+    raw_yes_bid=0, raw_no_bid=0, ask_yes=0, ask_no=0, spread=0,
+    yes_liq=0, no_liq=0, obi=0.0, bankroll=0.0, rolling_24h_loss=0.0,
+    ut_atr=0.0, ut_stop=0.0, signal_birth_time=0, signal_age_min=0.0, ob_stale=0,
+    btc_price_at_settlement=0.0, pnl_this_trade=0.0,
+)
+
+
+def _new_ctx(**fields):
+    ctx = _CTX_DEFAULTS.copy()
+    ctx.update(fields)
+    return ctx
+
 
 class StrategyController:
     def __init__(self, shared_state: SharedState):
@@ -245,240 +380,274 @@ class StrategyController:
         self.last_valid_ob_ts = 0.0
         self.last_heartbeat_ts  = 0.0
         self.session_start_time = time.time()  # Signals born before this are carry-overs
+        self.bg_tasks = None   # TaskGroup for background settlements; bound by main()
+        self.refresh_config()
 
         # FIX: Load persisted birth time so restarts don't re-fire the same signal
         Path(Config.STATE_DIR).mkdir(parents=True, exist_ok=True)
         self.acted_on_birth_time = self._load_birth_time()
 
-        if not os.path.exists(Config.LOG_FILE):
-            with open(Config.LOG_FILE, "w", newline="") as f:
-                csv.writer(f).writerow(LOG_COLUMNS)
+        # Log CSV stays open for the process lifetime; rows are buffered and
+        # flushed on any non-heartbeat event or every LOG_FLUSH_SEC
+        new_log = not os.path.exists(Config.LOG_FILE)
+        self._log_fh     = open(Config.LOG_FILE, "a", newline="", buffering=1 << 16)
+        self._csv_writer = csv.writer(self._log_fh)
+        if new_log:
+            self._csv_writer.writerow(LOG_COLUMNS)
+            self._log_fh.flush()
+        self._last_flush_ts = time.time()
+        # log() formats "%Y-%m-%d %H:%M:%S" once per second and appends the microseconds
+        self._ts_sec    = -1
+        self._ts_prefix = ""
+        # log() only appends and sets the event; log_writer() does the disk I/O
+        # off the event loop
+        self._log_rows  = deque()
+        self._log_ready = asyncio.Event()
+        atexit.register(self._close_log)
+
+    def refresh_config(self):
+        """Bind the Config values on_tick/log read every tick; re-run after a config.json reload."""
+        self._paper           = Config.PAPER_MODE
+        self._max_fills       = Config.MAX_FILLS_PER_SESSION
+        self._max_stalk_min   = Config.MAX_STALK_POST_SIGNAL_MIN
+        self._entry_max_min   = Config.TIME_ENTRY_MAX_MIN
+        self._ob_stale_sec    = Config.MAX_ORDERBOOK_STALE_SEC
+        self._veto_price      = Config.MARKET_VETO_PRICE
+        self._max_entry_price = Config.MARKET_MAX_ENTRY_PRICE
 
     # ── State Persistence ────────────────────────────────────────────────────
 
     def _load_birth_time(self):
         try:
             if os.path.exists(Config.STATE_FILE):
-                with open(Config.STATE_FILE) as f:
-                    return json.load(f).get("acted_on_birth_time")
+                with open(Config.STATE_FILE, "rb") as f:
+                    return orjson.loads(f.read()).get("acted_on_birth_time")
         except Exception:
             pass
         return None
 
     def _save_birth_time(self, birth_ts):
+        # Write-then-rename: a crash mid-write leaves the previous state intact
+        tmp = Config.STATE_FILE + ".tmp"
         try:
-            with open(Config.STATE_FILE, "w") as f:
-                json.dump({"acted_on_birth_time": birth_ts}, f)
+            with open(tmp, "wb") as f:
+                f.write(orjson.dumps({"acted_on_birth_time": birth_ts}))
+            os.replace(tmp, Config.STATE_FILE)
         except Exception:
             pass
 
     # ── Logging ──────────────────────────────────────────────────────────────
 
-    def log(self, event, ctx, msg=""):
-        ts   = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")
-        bank = self.risk.paper_balance if Config.PAPER_MODE else self.risk.real_balance
-        mode = "PAPER" if Config.PAPER_MODE else "LIVE"
+    def _write_rows(self, batch):
+        """Blocking CSV write of (event, row) pairs — runs in the default executor."""
+        self._csv_writer.writerows(row for _, row in batch)
+        now = time.time()
+        if any(ev != "HRTBT" for ev, _ in batch) or now - self._last_flush_ts >= Config.LOG_FLUSH_SEC:
+            self._log_fh.flush()
+            self._last_flush_ts = now
+
+    async def log_writer(self):
+        """Drain queued log rows in batches and write them in a worker thread."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._log_ready.wait()
+            self._log_ready.clear()
+            # Swap in a fresh deque; everything logged so far is this batch
+            batch, self._log_rows = self._log_rows, deque()
+            try:
+                await loop.run_in_executor(None, self._write_rows, batch)
+            except Exception as e:
+                print(f"[LOG WRITER] ERROR: {type(e).__name__}: {e}")
+
+    def _close_log(self):
+        if self._log_fh.closed:
+            return
+        # Rows still pending when the loop stopped are written synchronously
+        if self._log_rows:
+            self._csv_writer.writerows(row for _, row in self._log_rows)
+        self._log_fh.flush()
+        self._log_fh.close()
 
-        ep       = ctx.get("entry_price", 0)
-        yes_bid  = ctx.get("raw_yes_bid", 0)
-        no_bid   = ctx.get("raw_no_bid", 0)
-        ask_yes  = ctx.get("ask_yes", 0)
-        ask_no   = ctx.get("ask_no", 0)
-        side     = ctx.get("side", "")
+    def log(self, event, ctx, msg=""):
+        """ctx must come from _new_ctx(); it is filled in place with the computed columns."""
+        yes_bid = ctx["raw_yes_bid"]
+        no_bid  = ctx["raw_no_bid"]
 
         # Spread: ask minus bid on the traded side, else yes spread as default
-        if side == "yes":
-            spread = ask_yes - yes_bid if yes_bid > 0 else 0
-        elif side == "no":
-            spread = ask_no - no_bid if no_bid > 0 else 0
+        if ctx["side"] == "no":
+            spread = ctx["ask_no"] - no_bid if no_bid > 0 else 0
         else:
-            spread = ask_yes - yes_bid if yes_bid > 0 else 0
-
-        ob_stale = int(
-            (time.time() - self.last_valid_ob_ts) > Config.MAX_ORDERBOOK_STALE_SEC
+            spread = ctx["ask_yes"] - yes_bid if yes_bid > 0 else 0
+
+        now_ns    = time.time_ns()
+        sec, frac = divmod(now_ns, 1_000_000_000)
+        if sec != self._ts_sec:
+            self._ts_sec    = sec
+            self._ts_prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(sec))
+
+        ctx["timestamp"]        = f"{self._ts_prefix}.{frac // 1000:06d}"
+        ctx["event"]            = event
+        ctx["mode"]             = "PAPER" if self._paper else "LIVE"
+        ctx["spread"]           = spread
+        ctx["bankroll"]         = self.risk.paper_balance if self._paper else self.risk.real_balance
+        ctx["rolling_24h_loss"] = self.risk.rolling_24h_loss()
+        ctx["ob_stale"]         = int(
+            (now_ns / 1e9 - self.last_valid_ob_ts) > self._ob_stale_sec
         )
+        ctx["msg"]              = msg
+
+        row = [ctx[k] for k in LOG_COLUMNS]
 
-        row = [
-            ts,
-            event,
-            mode,
-            ctx.get("ticker", ""),
-            side,
-            ep,
-            ctx.get("qty", 0),
-            round(ctx.get("time_left", 0.0), 2),
-            round(ctx.get("btc", 0.0), 2),
-            ctx.get("strike", 0),
-            yes_bid,
-            no_bid,
-            ask_yes,
-            ask_no,
-            spread,
-            ctx.get("yes_liq", 0),
-            ctx.get("no_liq", 0),
-            round(ctx.get("obi", 0.0), 3),
-            round(bank, 2),
-            round(self.risk.rolling_24h_loss(), 2),
-            ctx.get("ut_signal", ""),
-            round(ctx.get("ut_atr", 0.0), 2),
-            round(ctx.get("ut_stop", 0.0), 2),
-            ctx.get("signal_birth_time", 0),
-            round(ctx.get("signal_age_min", 0.0), 2),
-            ob_stale,
-            ctx.get("filter_reason", ""),
-            ctx.get("settlement_source", ""),
-            round(ctx.get("btc_price_at_settlement", 0.0), 2),
-            round(ctx.get("pnl_this_trade", 0.0), 4),
-            msg
-        ]
-
-        with open(Config.LOG_FILE, "a", newline="") as f:
-            csv.writer(f).writerow(row)
+        self._log_rows.append((event, row))
+        self._log_ready.set()
 
         if event == "HRTBT":
             # Rich colored status line — matches V4 console style
-            sig   = ctx.get("ut_signal", "") or "--"
-            stale = "  [STALE-OB]" if ctx.get("ob_stale", 0) else ""
+            sig   = ctx["ut_signal"] or "--"
+            stale = "  [STALE-OB]" if ctx["ob_stale"] else ""
             pos   = "  [IN POSITION]" if ctx.get("has_position", False) else ""
             print(
                 f"\033[90m[{'HRTBT':^10}] "
-                f"{ctx.get('ticker','N/A')} | "
-                f"BTC:{ctx.get('btc',0):.2f} | "
-                f"Stop:{ctx.get('ut_stop',0):.2f} | "
-                f"ATR:{ctx.get('ut_atr',0):.2f} | "
-                f"Sig:{sig.upper()} Age:{ctx.get('signal_age_min',0):.1f}m | "
-                f"Y:{ctx.get('raw_yes_bid',0)}c N:{ctx.get('raw_no_bid',0)}c OBI:{ctx.get('obi',0):+.3f} | "
-                f"Bank:${ctx.get('bankroll',0):.2f}"
+                f"{ctx['ticker'] or 'N/A'} | "
+                f"BTC:{ctx['btc_price']:.2f} | "
+                f"Stop:{ctx['ut_stop']:.2f} | "
+                f"ATR:{ctx['ut_atr']:.2f} | "
+                f"Sig:{sig.upper()} Age:{ctx['signal_age_min']:.1f}m | "
+                f"Y:{ctx['raw_yes_bid']}c N:{ctx['raw_no_bid']}c OBI:{ctx['obi']:+.3f} | "
+                f"Bank:${ctx['bankroll']:.2f}"
                 f"{stale}{pos}\033[0m"
             )
         elif event in ("PAPER_BUY", "LIVE_BUY", "PAYOUT"):
-            print(f"\033[92m[{event:^14}] {ctx.get('ticker','')} | {msg}\033[0m")
+            print(f"\033[92m[{event:^14}] {ctx['ticker']} | {msg}\033[0m")
         elif event in ("SETTLE", "ERROR"):
-            print(f"\033[91m[{event:^14}] {ctx.get('ticker','')} | {msg}\033[0m")
+            print(f"\033[91m[{event:^14}] {ctx['ticker']} | {msg}\033[0m")
         elif event in ("SETTLE_VERIFIED",):
-            print(f"\033[94m[{event:^14}] {ctx.get('ticker','')} | {msg}\033[0m")
+            print(f"\033[94m[{event:^14}] {ctx['ticker']} | {msg}\033[0m")
         else:
-            print(f"[{event:^14}] {ctx.get('ticker','')} | {msg}")
+            print(f"[{event:^14}] {ctx['ticker']} | {msg}")
 
     # ── Settlement ───────────────────────────────────────────────────────────
 
     async def _bg_settle(self, kalshi, ticker, settlement_btc_price, strike, position):
-        await asyncio.sleep(Config.SETTLEMENT_INITIAL_DELAY)
+        # Runs in main()'s TaskGroup, where an escaping exception would cancel every
+        # loop — a failed settlement is logged, never propagated
+        try:
+            await asyncio.sleep(Config.SETTLEMENT_INITIAL_DELAY)
 
-        verified = None
-        for _ in range(Config.SETTLEMENT_MAX_RETRIES):
-            try:
-                md = (await kalshi.get_market(ticker)).get("market", {})
-                if md.get("status") in ("settled", "finalized") and md.get("result"):
-                    verified = md["result"].lower()
-                    break
-                await asyncio.sleep(Config.SETTLEMENT_RETRY_INTERVAL)
-            except Exception:
-                await asyncio.sleep(Config.SETTLEMENT_RETRY_INTERVAL)
-
-        outcome = 1 if verified == "yes" else (
-            0 if verified == "no" else (
-                1 if settlement_btc_price > strike else 0
+            verified = None
+            for _ in range(Config.SETTLEMENT_MAX_RETRIES):
+                try:
+                    md = (await kalshi.get_market(ticker)).get("market", {})
+                    if md.get("status") in ("settled", "finalized") and md.get("result"):
+                        verified = md["result"].lower()
+                        break
+                    await asyncio.sleep(Config.SETTLEMENT_RETRY_INTERVAL)
+                except Exception:
+                    await asyncio.sleep(Config.SETTLEMENT_RETRY_INTERVAL)
+
+            outcome = 1 if verified == "yes" else (
+                0 if verified == "no" else (
+                    1 if settlement_btc_price > strike else 0
+                )
             )
-        )
-        source = "kalshi_verified" if verified else "spot_fallback"
+            source = "kalshi_verified" if verified else "spot_fallback"
 
-        if position:
-            won = (
-                (position["side"] == "yes" and outcome == 1) or
-                (position["side"] == "no"  and outcome == 0)
-            )
-            # Build a self-contained settlement context carrying full trade detail
-            settle_ctx = {
-                "ticker":                  ticker,
-                "side":                    position["side"],
-                "entry_price":             position["entry_price"],
-                "qty":                     position["qty"],
-                "strike":                  strike,
-                "btc":                     settlement_btc_price,
-                "btc_price_at_settlement": settlement_btc_price,
-                "settlement_source":       source,
-                "ut_signal":               position.get("ut_signal", ""),
-                "ut_atr":                  position.get("ut_atr", 0.0),
-                "ut_stop":                 position.get("ut_stop", 0.0),
-                "signal_birth_time":       position.get("signal_birth_time", 0),
-                "signal_age_min":          position.get("signal_age_min", 0.0),
-            }
-            if won:
-                payout = position["qty"] * 1.00
-                cost   = position["qty"] * (position["entry_price"] / 100.0)
-                pnl    = payout - cost
-                self.risk.paper_balance += payout
-                self.risk.record_pnl(pnl)
-                settle_ctx["pnl_this_trade"] = pnl
-                self.log("PAYOUT", settle_ctx, f"WIN! Payout: ${payout:.2f} | PnL: ${pnl:.4f}")
+            if position:
+                won = (
+                    (position["side"] == "yes" and outcome == 1) or
+                    (position["side"] == "no"  and outcome == 0)
+                )
+                # Build a self-contained settlement context carrying full trade detail
+                settle_ctx = _new_ctx(
+                    ticker                  = ticker,
+                    side                    = position["side"],
+                    entry_price             = position["entry_price"],
+                    qty                     = position["qty"],
+                    strike                  = strike,
+                    btc_price               = settlement_btc_price,
+                    btc_price_at_settlement = settlement_btc_price,
+                    settlement_source       = source,
+                    ut_signal               = position.get("ut_signal", ""),
+                    ut_atr                  = position.get("ut_atr", 0.0),
+                    ut_stop                 = position.get("ut_stop", 0.0),
+                    signal_birth_time       = position.get("signal_birth_time", 0),
+                    signal_age_min          = position.get("signal_age_min", 0.0),
+                )
+                if won:
+                    payout = position["qty"] * 1.00
+                    cost   = position["qty"] * (position["entry_price"] / 100.0)
+                    pnl    = payout - cost
+                    self.risk.paper_balance += payout
+                    self.risk.record_pnl(pnl)
+                    settle_ctx["pnl_this_trade"] = pnl
+                    self.log("PAYOUT", settle_ctx, f"WIN! Payout: ${payout:.2f} | PnL: ${pnl:.4f}")
+                else:
+                    cost = position["qty"] * (position["entry_price"] / 100.0)
+                    pnl  = -cost
+                    self.risk.record_pnl(pnl)
+                    settle_ctx["pnl_this_trade"] = pnl
+                    self.log("SETTLE", settle_ctx, f"LOSS. Cost: ${cost:.2f} | PnL: ${pnl:.4f}")
             else:
-                cost = position["qty"] * (position["entry_price"] / 100.0)
-                pnl  = -cost
-                self.risk.record_pnl(pnl)
-                settle_ctx["pnl_this_trade"] = pnl
-                self.log("SETTLE", settle_ctx, f"LOSS. Cost: ${cost:.2f} | PnL: ${pnl:.4f}")
-        else:
-            self.log("SETTLE_VERIFIED", {
-                "ticker": ticker,
-                "settlement_source": source,
-                "btc_price_at_settlement": settlement_btc_price
-            }, f"Market Roll: {str(verified).upper()}")
+                self.log("SETTLE_VERIFIED", _new_ctx(
+                    ticker                  = ticker,
+                    settlement_source       = source,
+                    btc_price_at_settlement = settlement_btc_price,
+                ), f"Market Roll: {str(verified).upper()}")
+        except Exception as e:
+            print(f"[SETTLE] ERROR on {ticker}: {type(e).__name__}: {e}")
+            setup_logging().error(f"Settlement error on {ticker}: {e}")
 
     # ── Main Tick Handler ────────────────────────────────────────────────────
 
     async def on_tick(self, kalshi, data):
-        async with self.shared.lock:
-            cur_sig  = self.shared.ut_signal
-            birth_ts = self.shared.signal_birth_time
-            atr      = self.shared.ut_atr
-            stop     = self.shared.ut_stop
-            btc      = self.shared.latest_btc
-
-        signal_age_min = (time.time() - birth_ts) / 60.0 if birth_ts > 0 else 999.0
-        ob_stale = (time.time() - self.last_valid_ob_ts) > Config.MAX_ORDERBOOK_STALE_SEC
-
-        ctx = {
-            "ticker":            data["ticker"],
-            "time_left":         data["minutes_left"],
-            "btc":               btc,
-            "strike":            data["strike"],
-            "raw_yes_bid":       data["raw_yes_bid"],
-            "raw_no_bid":        data["raw_no_bid"],
-            "ask_yes":           data["ask_yes"],
-            "ask_no":            data["ask_no"],
-            "yes_liq":           data["yes_liq"],
-            "no_liq":            data["no_liq"],
-            "obi":               data["obi"],
-            "ut_signal":         cur_sig,
-            "ut_atr":            atr,
-            "ut_stop":           stop,
-            "signal_birth_time": birth_ts,
-            "signal_age_min":    signal_age_min,
-        }
+        now = time.time()
+        # Filled out for the session or holding: nothing can be entered until the
+        # roll, so a tick only matters when a heartbeat is due
+        idle      = self.session_fills >= self._max_fills or self.active_position is not None
+        heartbeat = now - self.last_heartbeat_ts > 10.0
+        if idle and not heartbeat:
+            return
+
+        cur_sig, atr, stop, btc, birth_ts = self.shared.snapshot
+        signal_age_min = (now - birth_ts) / 60.0 if birth_ts > 0 else 999.0
+        ob_stale = (now - self.last_valid_ob_ts) > self._ob_stale_sec
+
+        ctx = _new_ctx(
+            ticker            = data.ticker,
+            time_left         = data.minutes_left,
+            btc_price         = btc,
+            strike            = data.strike,
+            raw_yes_bid       = data.raw_yes_bid,
+            raw_no_bid        = data.raw_no_bid,
+            ask_yes           = data.ask_yes,
+            ask_no            = data.ask_no,
+            yes_liq           = data.yes_liq,
+            no_liq            = data.no_liq,
+            obi               = data.obi,
+            ut_signal         = cur_sig,
+            ut_atr            = atr,
+            ut_stop           = stop,
+            signal_birth_time = birth_ts,
+            signal_age_min    = signal_age_min,
+        )
 
         # Heartbeat every 10 seconds
-        if time.time() - self.last_heartbeat_ts > 10.0:
-            bank = self.risk.paper_balance if Config.PAPER_MODE else self.risk.real_balance
-            ctx["bankroll"]     = bank
-            ctx["ob_stale"]     = int(ob_stale)
+        if heartbeat:
             ctx["has_position"] = self.active_position is not None
             self.log("HRTBT", ctx)
             self.last_heartbeat_ts = time.time()
 
         # ── Gate checks with explicit filter_reason ───────────────────────
-        if self.session_fills >= Config.MAX_FILLS_PER_SESSION:
-            return  # Silent — already traded this session, no noise in log
-        if self.active_position:
-            return
+        if idle:
+            return  # Silent — already traded this session or in a position, no noise in log
         if self.acted_on_birth_time == birth_ts:
             ctx["filter_reason"] = "already_acted_this_signal"
             return
-        if signal_age_min > Config.MAX_STALK_POST_SIGNAL_MIN:
+        if signal_age_min > self._max_stalk_min:
             ctx["filter_reason"] = f"signal_too_old_{signal_age_min:.1f}m"
             return
-        if data["minutes_left"] < Config.TIME_ENTRY_MAX_MIN:
-            ctx["filter_reason"] = f"too_close_to_expiry_{data['minutes_left']:.1f}m"
+        if data.minutes_left < self._entry_max_min:
+            ctx["filter_reason"] = f"too_close_to_expiry_{data.minutes_left:.1f}m"
             return
         if ob_stale:
             ctx["filter_reason"] = "orderbook_stale"
@@ -491,14 +660,16 @@ class StrategyController:
 
         # ── Determine side and maker price ───────────────────────────────
         side     = "yes" if cur_sig == "buy" else "no"
-        best_bid = data["raw_yes_bid"] if side == "yes" else data["raw_no_bid"]
-        best_ask = data["ask_yes"]     if side == "yes" else data["ask_no"]
-        maker_price = max(1, min(99, (best_bid + 1) if best_ask > (best_bid + 1) else best_bid))
+        best_bid = data.raw_yes_bid if side == "yes" else data.raw_no_bid
+        best_ask = data.ask_yes     if side == "yes" else data.ask_no
+        # Penny-jump the bid when the spread allows; the entry band below also bounds it to 1..99
+        penny       = best_bid + 1
+        maker_price = penny if best_ask > penny else best_bid
 
         ctx["side"]        = side
         ctx["entry_price"] = maker_price
 
-        if not (Config.MARKET_VETO_PRICE <= maker_price <= Config.MARKET_MAX_ENTRY_PRICE):
+        if not (self._veto_price <= maker_price <= self._max_entry_price):
             ctx["filter_reason"] = f"price_out_of_range_{maker_price}c"
             return
 
@@ -512,13 +683,14 @@ class StrategyController:
         # ── Commit ───────────────────────────────────────────────────────
         # FIX: Persist birth time before placing order so a crash after fill
         #      doesn't leave acted_on_birth_time un-persisted
+        loop = asyncio.get_running_loop()
         self.acted_on_birth_time = birth_ts
-        self._save_birth_time(birth_ts)
+        await loop.run_in_executor(None, self._save_birth_time, birth_ts)
         self.session_fills += 1
 
         # Store indicator snapshot on position so settlement row is self-contained
         position_record = {
-            "ticker":            data["ticker"],
+            "ticker":            data.ticker,
             "side":              side,
             "qty":               qty,
             "entry_price":       maker_price,
@@ -529,7 +701,7 @@ class StrategyController:
             "signal_age_min":    round(signal_age_min, 2),
         }
 
-        if Config.PAPER_MODE:
+        if self._paper:
             self.risk.paper_balance -= qty * (maker_price / 100.0)
             self.active_position = position_record
             self.log("PAPER_BUY", ctx,
@@ -537,7 +709,7 @@ class StrategyController:
         else:
             try:
                 await kalshi.create_order(
-                    ticker=data["ticker"], action="buy", type="limit",
+                    ticker=data.ticker, action="buy", type="limit",
                     side=side, count=qty, price=maker_price
                 )
                 self.active_position = position_record
@@ -548,13 +720,31 @@ class StrategyController:
                 # Roll back since order didn't land
                 self.session_fills -= 1
                 self.acted_on_birth_time = None
-                self._save_birth_time(None)
+                await loop.run_in_executor(None, self._save_birth_time, None)
 
 
 # ═════════════════════════════════════════════════════════════════════════════
 # CANDLE SYNTHESIS FROM TICK STREAM
 # ═════════════════════════════════════════════════════════════════════════════
 
+def _minute_bucket(ts_ms: int) -> int:
+    """Floor an integer epoch-ms timestamp to the start of its UTC minute."""
+    return ts_ms - ts_ms % 60_000
+
+
+class _Candle:
+    """The forming candle — slot attributes, mutated in place on every tick."""
+    __slots__ = ("timestamp", "open", "high", "low", "close", "volume")
+
+    def __init__(self, ts, price):
+        self.timestamp = ts
+        self.open = self.high = self.low = self.close = price
+        self.volume = 0.0
+
+    def as_row(self):
+        return (self.timestamp, self.open, self.high, self.low, self.close, self.volume)
+
+
 class CandleBuilder:
     """
     Builds 1-minute OHLCV candles from a stream of (timestamp_ms, price) ticks.
@@ -564,73 +754,122 @@ class CandleBuilder:
       - If a new minute has started: finalize the previous candle, append to
         history, open a new candle.
 
-    Maintains a rolling deque of up to MAX_CANDLES closed candles plus the
-    currently-forming candle. Call as_dataframe() to get the full list with
-    the live candle appended — ready to feed into calculate_ut_bot().
+    Keeps up to MAX_CANDLES closed candles in a preallocated float64 buffer
+    (see `closed`) plus the currently-forming candle.
+
+    ut_bot() keeps the indicator incrementally: one full kernel pass over the
+    closed columns seeds the state at the last closed candle, each newly closed candle
+    then advances it by a single step, and the live candle is evaluated as a
+    one-step extension that is never committed.
     """
     MAX_CANDLES = 1000
+    # Row order of the closed-candle buffer — same field order as fetch_ohlcv
+    TS, OPEN, HIGH, LOW, CLOSE, VOLUME = range(6)
 
     def __init__(self):
-        self.closed  = collections.deque(maxlen=self.MAX_CANDLES)
-        self.current = None   # dict: timestamp_ms, open, high, low, close, volume
+        # Closed candles, one contiguous row per field. Appends land at _end; once the
+        # spare half is used up the newest candles slide back to the front, so the live
+        # window is always the zero-copy slice [_start:_end].
+        self._buf    = np.empty((6, 2 * self.MAX_CANDLES))
+        self._start  = 0
+        self._end    = 0
+        self.current = None   # _Candle: timestamp_ms, open, high, low, close, volume
+        # Reused UT Bot output buffers: closed candles + the live one
+        self.atr_buf  = np.zeros(self.MAX_CANDLES + 1)
+        self.stop_buf = np.zeros(self.MAX_CANDLES + 1)
+        # Committed UT Bot state at the last closed candle (see _ut_bot_step)
+        self._ut_state  = None
+        self._ut_ts     = None    # timestamp of the candle _ut_state belongs to
+        self._ut_params = None    # (key_value, atr_period) the state was built with
 
-    def _minute_bucket(self, ts_ms: float) -> int:
-        """Floor timestamp to the start of its UTC minute (in ms)."""
-        return int(ts_ms // 60_000) * 60_000
+    @property
+    def closed(self):
+        """Closed candles as a (6, n) view, oldest first; index rows with TS..VOLUME."""
+        return self._buf[:, self._start:self._end]
 
-    def update(self, ts_ms: float, price: float) -> bool:
+    @property
+    def n_closed(self) -> int:
+        return self._end - self._start
+
+    def append_closed(self, candle):
+        """Append one closed [ts, open, high, low, close, volume] candle."""
+        if self._end == self._buf.shape[1]:
+            keep = self.MAX_CANDLES - 1
+            self._buf[:, :keep] = self._buf[:, self._end - keep:self._end]
+            self._start, self._end = 0, keep
+        self._buf[:, self._end] = candle
+        self._end += 1
+        if self._end - self._start > self.MAX_CANDLES:
+            self._start += 1
+
+    def update(self, ts_ms: int, price: float) -> bool:
         """
         Feed a new tick. Returns True if a candle was just closed
         (i.e. the UT Bot should be recalculated).
         """
-        bucket = self._minute_bucket(ts_ms)
-        closed_candle = False
+        bucket = _minute_bucket(ts_ms)
+        c = self.current
 
-        if self.current is None:
+        if c is None:
             # First tick ever
-            self.current = dict(timestamp=bucket, open=price, high=price,
-                                low=price, close=price, volume=0.0)
-        elif bucket != self.current["timestamp"]:
+            self.current = _Candle(bucket, price)
+            return False
+        if bucket != c.timestamp:
             # Minute boundary crossed — finalize current candle
-            self.closed.append([
-                self.current["timestamp"],
-                self.current["open"],
-                self.current["high"],
-                self.current["low"],
-                self.current["close"],
-                self.current["volume"],
-            ])
-            self.current = dict(timestamp=bucket, open=price, high=price,
-                                low=price, close=price, volume=0.0)
-            closed_candle = True
-        else:
-            # Still in the same minute — update running candle
-            self.current["high"]  = max(self.current["high"],  price)
-            self.current["low"]   = min(self.current["low"],   price)
-            self.current["close"] = price
+            self.append_closed(c.as_row())
+            self.current = _Candle(bucket, price)
+            return True
+
+        # Still in the same minute — update running candle
+        if price > c.high:
+            c.high = price
+        elif price < c.low:
+            c.low = price
+        c.close = price
+        return False
+
+    def seed_ut_bot(self, key_value, atr_period):
+        """
+        Full kernel pass over the closed candles, committing the state at the
+        last one. Runs once (again only if the parameters change); ut_bot()
+        steps forward from here.
+        """
+        closed = self.closed
+        atr, stops, signal, birth_ts = _ut_bot_arrays(
+            closed[self.TS], closed[self.HIGH], closed[self.LOW], closed[self.CLOSE],
+            key_value, atr_period, atr=self.atr_buf, stops=self.stop_buf
+        )
+        self._ut_state  = (float(atr[-1]), float(stops[-1]), float(closed[self.CLOSE, -1]),
+                           signal == "buy", birth_ts)
+        self._ut_ts     = closed[self.TS, -1]
+        self._ut_params = (key_value, atr_period)
 
-        return closed_candle
+    def ut_bot(self, key_value, atr_period):
+        """
+        UT Bot on the live candle as (signal, atr, stop, close, birth_ts).
+        Requires `ready`. Work per call is one step per candle closed since the
+        previous call, plus one for the live candle.
+        """
+        if self._ut_state is None or self._ut_params != (key_value, atr_period):
+            self.seed_ut_bot(key_value, atr_period)
+        else:
+            closed = self.closed
+            first = int(np.searchsorted(closed[self.TS], self._ut_ts, side="right"))
+            for ts, _, high, low, close, _ in closed[:, first:].T.tolist():
+                self._ut_state = _ut_bot_step(self._ut_state, ts, high, low, close, key_value, atr_period)
+                self._ut_ts    = ts
 
-    def as_dataframe(self):
-        """Return closed candles + live forming candle as a DataFrame."""
-        rows = list(self.closed)
+        state = self._ut_state
         if self.current:
-            rows.append([
-                self.current["timestamp"],
-                self.current["open"],
-                self.current["high"],
-                self.current["low"],
-                self.current["close"],
-                self.current["volume"],
-            ])
-        if not rows:
-            return None
-        return pd.DataFrame(rows, columns=["timestamp","open","high","low","close","volume"])
+            c     = self.current
+            state = _ut_bot_step(state, c.timestamp, c.high, c.low, c.close, key_value, atr_period)
+        atr, stop, close, above, birth_ts = state
+        return ("buy" if above else "sell"), atr, stop, close, birth_ts
 
     @property
     def ready(self) -> bool:
         """Need at least atr_period + 2 closed candles before UT Bot is reliable."""
-        return len(self.closed) >= (Config.UT_BOT_ATR_PERIOD + 2)
+        return self.n_closed >= (Config.UT_BOT_ATR_PERIOD + 2)
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -641,13 +880,18 @@ async def watch_exchange_loop(ex, bot):
     """
     Restored from V4. Subscribes to the Coinbase order book WebSocket and
     keeps ex.orderbooks[symbol] updated continuously in memory.
-    The candle loop reads from that cache — no polling, no REST.
+    Each update also caches the top-of-book mid on ex._mid, which is all
+    the candle loop reads — no polling, no REST, no book lookups.
     Reconnects automatically on any error.
     """
     name = getattr(ex, "id", str(ex))
     while True:
         try:
-            await ex.watch_order_book(Config.SYMBOL)
+            ob = await ex.watch_order_book(Config.SYMBOL)
+            try:
+                ex._mid = (ob["bids"][0][0] + ob["asks"][0][0]) / 2.0
+            except IndexError:
+                pass    # One side momentarily empty — keep the last mid
         except Exception as e:
             print(f"[WS {name}] Reconnecting: {type(e).__name__}: {e}")
             await asyncio.sleep(5)
@@ -658,8 +902,8 @@ async def ohlcv_candle_loop(exchanges: dict, shared_state, bot):
     V5.1 approach: synthesize 1-minute candles from the live WebSocket
     order book mid-price, exactly as V4 did.
 
-    Every 0.5s, reads the mid-price from each exchange's cached order book
-    (kept live by watch_exchange_loop), feeds it into CandleBuilder, and
+    Every 0.5s, reads the mid-price each exchange's watch_exchange_loop
+    cached on ex._mid, feeds it into CandleBuilder, and
     recalculates UT Bot whenever a candle closes or a set interval elapses.
 
     Falls back to REST fetch_ohlcv for the initial candle history so the
@@ -671,14 +915,18 @@ async def ohlcv_candle_loop(exchanges: dict, shared_state, bot):
 
     # ── Seed with REST history so ATR is ready immediately on startup ─────────
     primary_ex = list(exchanges.values())[0]
+    single_ex  = len(exchanges) == 1
     try:
         print("[CANDLE LOOP] Seeding candle history from REST...")
         seed = await primary_ex.fetch_ohlcv(
             Config.SYMBOL, timeframe="1m", limit=Config.UT_BOT_ATR_PERIOD + 50
         )
         for c in seed[:-1]:   # Exclude the last (still-forming) candle
-            builder.closed.append(c)
-        print(f"[CANDLE LOOP] Seeded {len(builder.closed)} closed candles. Switching to WebSocket tick feed.")
+            builder.append_closed(c)
+        print(f"[CANDLE LOOP] Seeded {builder.n_closed} closed candles. Switching to WebSocket tick feed.")
+        # Seed the indicator now (and load the JIT kernel) so the first live tick only steps it
+        if builder.ready:
+            builder.seed_ut_bot(Config.UT_BOT_SENSITIVITY, Config.UT_BOT_ATR_PERIOD)
     except Exception as e:
         print(f"[CANDLE LOOP] REST seed failed ({e}) — will build candles from ticks only.")
 
@@ -687,24 +935,26 @@ async def ohlcv_candle_loop(exchanges: dict, shared_state, bot):
     while True:
         try:
             await asyncio.sleep(0.5)
-            update_config_from_file()
+            if update_config_from_file():
+                bot.refresh_config()
 
-            # Read mid-price from each exchange's live cached order book
-            prices = []
-            for ex in exchanges.values():
-                try:
-                    ob  = ex.orderbooks.get(Config.SYMBOL, {})
-                    bid = ob["bids"][0][0]
-                    ask = ob["asks"][0][0]
-                    prices.append((bid + ask) / 2.0)
-                except (IndexError, KeyError, TypeError):
+            # Mid-price cached by each exchange's watch loop
+            if single_ex:
+                price = primary_ex._mid
+                if price is None:
                     continue
-
-            if not prices:
-                continue
-
-            price  = float(np.median(prices))   # Median across exchanges if multiple
-            ts_ms  = time.time() * 1000.0
+            else:
+                prices = [ex._mid for ex in exchanges.values() if ex._mid is not None]
+                if not prices:
+                    continue
+                # Median across exchanges; the common two-venue case skips the sort
+                if len(prices) == 1:
+                    price = prices[0]
+                elif len(prices) == 2:
+                    price = (prices[0] + prices[1]) * 0.5
+                else:
+                    price = statistics.median(prices)
+            ts_ms  = time.time_ns() // 1_000_000
 
             closed_candle = builder.update(ts_ms, price)
 
@@ -713,29 +963,22 @@ async def ohlcv_candle_loop(exchanges: dict, shared_state, bot):
             if not (closed_candle or (now - last_recalc_ts) >= 5.0):
                 continue
             if not builder.ready:
-                print(f"[CANDLE LOOP] Warming up... {len(builder.closed)}/{Config.UT_BOT_ATR_PERIOD + 2} candles", end="\r", flush=True)
+                print(f"[CANDLE LOOP] Warming up... {builder.n_closed}/{Config.UT_BOT_ATR_PERIOD + 2} candles", end="\r", flush=True)
                 continue
 
-            df = builder.as_dataframe()
-            if df is None or len(df) < Config.UT_BOT_ATR_PERIOD + 2:
-                continue
-
-            df  = calculate_ut_bot(df, Config.UT_BOT_SENSITIVITY, Config.UT_BOT_ATR_PERIOD)
-
             # Use live forming candle for signal, stop, ATR, and price.
             # This means the bot reacts the moment BTC crosses the trailing
             # stop on the live candle, not after waiting for it to close.
-            # The closed candle (last_c) is still used for birth_ts so that
-            # signal birth time is only stamped on confirmed crossovers.
-            last_c = df.iloc[-2]
-            live_c = df.iloc[-1]
-
-            await shared_state.update_indicator(
-                live_c["ut_signal"],
-                float(live_c["atr"]),
-                float(live_c["xATRTrailingStop"]),
-                float(live_c["close"]),
-                float(live_c["birth_ts"])
+            signal, atr, stop, close, birth_ts = builder.ut_bot(
+                Config.UT_BOT_SENSITIVITY, Config.UT_BOT_ATR_PERIOD
+            )
+
+            shared_state.update_indicator(
+                signal,
+                float(atr),
+                float(stop),
+                float(close),
+                float(birth_ts)
             )
 
             last_recalc_ts = now
@@ -746,56 +989,159 @@ async def ohlcv_candle_loop(exchanges: dict, shared_state, bot):
             await asyncio.sleep(2)
 
 
-async def kalshi_market_loop(kalshi, market_queue, bot):
+def _parse_close_epoch(close_time: str) -> float:
+    """Kalshi ISO-8601 close_time ('...Z') -> epoch seconds."""
+    return datetime.fromisoformat(close_time.replace("Z", "+00:00")).timestamp()
+
+
+OB_DEPTH = 5   # Book levels per side that feed liquidity and OBI
+
+
+def _best_sizes(side, out):
+    """Write the sizes of the best len(out) bids of a SortedDict side into `out`, zero-padded."""
+    n = min(len(side), out.size)
+    # One reversed slice of the values view, copied in by NumPy — no per-level Python loop
+    out[:n] = side.values()[-1:-n - 1:-1]
+    out[n:] = 0.0
+    return out
+
+
+@njit(cache=True)
+def _book_stats(yes_sz, no_sz, y_bid, n_bid, obi_out):
+    """
+    Everything a book update changes, in one compiled pass: OBI over the best
+    1..k levels, (cum_yes - cum_no) / (cum_yes + cum_no), written into obi_out;
+    returns (yes_liq, no_liq, ask_yes, ask_no) with liquidity over all k levels.
+    """
+    cy = 0.0
+    cn = 0.0
+    for k in range(yes_sz.size):
+        cy += yes_sz[k]
+        cn += no_sz[k]
+        tot = cy + cn
+        obi_out[k] = (cy - cn) / tot if tot > 0 else 0.0
+    # Buying YES lifts the best NO bid's complement, and vice versa
+    ask_yes = 100 - n_bid if n_bid > 0 else 99
+    ask_no  = 100 - y_bid if y_bid > 0 else 99
+    return cy, cn, ask_yes, ask_no
+
+
+# Transient transport failures: back off and reconnect. Anything else is a bug
+# or a malformed payload — log it and carry on without the backoff stall.
+_NET_ERRORS = (OSError, asyncio.TimeoutError, aiohttp.ClientError, httpx.HTTPError)
+
+
+async def kalshi_market_loop(kalshi, bot):
+    """
+    Streams the current session's Kalshi book and drives the strategy directly:
+    each book update becomes a TickData handed straight to bot.on_tick(). A new
+    ticker triggers the session roll (background settlement of the previous one).
+    """
+    logger = setup_logging()
+    # ticker -> close_time as epoch seconds; each market's ISO string is parsed once
+    close_epochs = {}
+    retry = 0
     while True:
         try:
-            await asyncio.sleep(0.5)
+            # REST only to find the session's market; the book itself is streamed
             m_resp = await kalshi.get_markets(series_ticker=Config.SERIES_TICKER, status="open")
-            now    = datetime.now(timezone.utc)
-            future = sorted(
-                [m for m in m_resp.get("markets", [])
-                 if datetime.fromisoformat(m["close_time"].replace("Z", "+00:00")) > now],
-                key=lambda x: x["close_time"]
+            now_ts = time.time()
+            for t in [t for t, ce in close_epochs.items() if ce <= now_ts]:
+                del close_epochs[t]   # Expired sessions
+            for m in m_resp.get("markets", []):
+                if m["ticker"] not in close_epochs:
+                    close_epochs[m["ticker"]] = _parse_close_epoch(m["close_time"])
+
+            # Nearest-expiring future market — one O(n) pass, no sort
+            target = min(
+                (m for m in m_resp.get("markets", []) if close_epochs[m["ticker"]] > now_ts),
+                key=lambda x: close_epochs[x["ticker"]],
+                default=None
             )
-            if not future: continue
-
-            target = future[0]
-            ticker = target["ticker"]
-            strike = target.get("floor_strike") or target.get("strike_price") or 0
-
-            ob    = (await kalshi.get_orderbook(ticker)).get("orderbook", {})
-            y_bid = sorted(ob.get("yes") or [], key=lambda x: x[0], reverse=True)[0][0] if ob.get("yes") else 0
-            n_bid = sorted(ob.get("no")  or [], key=lambda x: x[0], reverse=True)[0][0] if ob.get("no")  else 0
-
-            if y_bid > 0 or n_bid > 0:
-                bot.last_valid_ob_ts = time.time()
-
-            # Top 5 levels of liquidity on each side
-            y_liq = sum(l[1] for l in (ob.get("yes") or [])[:5])
-            n_liq = sum(l[1] for l in (ob.get("no")  or [])[:5])
-
-            close_dt     = datetime.fromisoformat(target["close_time"].replace("Z", "+00:00"))
-            minutes_left = (close_dt - now).total_seconds() / 60.0
-
-            data = {
-                "ticker":      ticker,
-                "strike":      strike,
-                "minutes_left": minutes_left,
-                "raw_yes_bid": y_bid,
-                "raw_no_bid":  n_bid,
-                "ask_yes":     100 - n_bid if n_bid > 0 else 99,
-                "ask_no":      100 - y_bid if y_bid > 0 else 99,
-                "yes_liq":     y_liq,
-                "no_liq":      n_liq,
-                "obi":         (y_liq - n_liq) / (y_liq + n_liq) if (y_liq + n_liq) > 0 else 0.0,
-            }
-
-            if market_queue.full():
-                market_queue.get_nowait()
-            await market_queue.put(data)
+            if target is None:
+                await asyncio.sleep(0.5)
+                continue
 
-        except Exception:
-            await asyncio.sleep(2)
+            ticker      = target["ticker"]
+            strike      = target.get("floor_strike") or target.get("strike_price") or 0
+            # Session end on the monotonic clock: the tick path does one float
+            # compare, and a wall-clock step can't end a session early or late
+            deadline    = time.monotonic() + (close_epochs[ticker] - time.time())
+
+            last_seq = None
+            yes_sz   = np.zeros(OB_DEPTH)
+            no_sz    = np.zeros(OB_DEPTH)
+            data     = TickData(ticker=ticker, strike=strike, obi_depths=np.empty(OB_DEPTH))
+            first_tick = True
+            async with aclosing(kalshi.watch_orderbook(ticker)) as book:
+                async for seq, yes, no in book:
+                    mono = time.monotonic()
+                    if mono >= deadline:
+                        break   # session over — look up the next market
+
+                    # Book-derived stats change only with the book; quiet-period
+                    # re-emits (same seq) reuse them
+                    if seq != last_seq:
+                        last_seq = seq
+                        y_bid = yes.peekitem(-1)[0] if yes else 0
+                        n_bid = no.peekitem(-1)[0]  if no  else 0
+                        # Liquidity and OBI over the top OB_DEPTH levels; obi_depths[k-1]
+                        # is the imbalance over the best k levels per side
+                        y_liq, n_liq, ask_yes, ask_no = _book_stats(
+                            _best_sizes(yes, yes_sz), _best_sizes(no, no_sz),
+                            y_bid, n_bid, data.obi_depths,
+                        )
+                        data.raw_yes_bid = y_bid
+                        data.raw_no_bid  = n_bid
+                        data.ask_yes     = ask_yes
+                        data.ask_no      = ask_no
+                        data.yes_liq     = int(y_liq)
+                        data.no_liq      = int(n_liq)
+                        data.obi         = float(data.obi_depths[-1])
+
+                    if data.raw_yes_bid > 0 or data.raw_no_bid > 0:
+                        bot.last_valid_ob_ts = time.time()
+
+                    data.minutes_left = (deadline - mono) / 60.0
+
+                    # Per-session bookkeeping runs on the session's first tick only
+                    if first_tick:
+                        first_tick = False
+                        retry      = 0
+                        # Session roll: new ticker detected
+                        if bot.prev_ticker and ticker != bot.prev_ticker:
+                            bot.bg_tasks.create_task(bot._bg_settle(
+                                kalshi,
+                                bot.prev_ticker,
+                                bot.shared.latest_btc,
+                                bot.prev_strike,
+                                bot.active_position
+                            ))
+                            bot.active_position = None
+                            bot.session_fills   = 0
+                            bot.session_start_time = time.time()  # New session: only accept fresh signals
+                            # Note: acted_on_birth_time is NOT reset here — intentional.
+                            # Prevents re-entry on the same signal in the new session.
+
+                        bot.prev_ticker = ticker
+                        bot.prev_strike = strike
+
+                    try:
+                        await bot.on_tick(kalshi, data)
+                    except Exception as e:
+                        # A strategy bug must not drop the book subscription
+                        print(f"[STRATEGY] on_tick ERROR: {type(e).__name__}: {e}")
+                        logger.error(f"on_tick error: {e}")
+
+        except _NET_ERRORS as e:
+            delay = min(10.0, 0.5 * 2 ** retry)
+            retry += 1
+            print(f"[KALSHI] Reconnecting in {delay:.1f}s: {type(e).__name__}: {e}")
+            await asyncio.sleep(delay)
+        except Exception as e:
+            print(f"[KALSHI] ERROR: {type(e).__name__}: {e}")
+            logger.error(f"Kalshi market loop error: {e}")
+            await asyncio.sleep(0.5)   # One poll interval — never a hot loop on a bad payload
 
 
 async def main():
@@ -810,6 +1156,7 @@ async def main():
             print(f"[STARTUP] WARNING: Exchange '{name}' not found in ccxt.pro — skipping.")
             continue
         ex = getattr(ccxt, name)({"newUpdates": True})
+        ex._mid = None   # Top-of-book mid, maintained by watch_exchange_loop
         exchanges[name] = ex
         print(f"[STARTUP] Exchange loaded: {name} | watch_order_book: {hasattr(ex, 'watch_order_book')}")
 
@@ -820,41 +1167,26 @@ async def main():
     print(f"[STARTUP] Mode: {'PAPER' if Config.PAPER_MODE else '*** LIVE ***'} | Symbol: {Config.SYMBOL}")
     print(f"[STARTUP] Strategy: watch_order_book WebSocket → tick-synthesized 1m candles → UT Bot")
 
-    market_queue = asyncio.Queue(maxsize=1)
-
-    # Start one WebSocket order book listener per exchange (V4 pattern)
-    for ex in exchanges.values():
-        asyncio.create_task(watch_exchange_loop(ex, bot))
-
-    asyncio.create_task(ohlcv_candle_loop(exchanges, shared, bot))
-    asyncio.create_task(kalshi_market_loop(kalshi, market_queue, bot))
-
-    while True:
-        try:
-            data = await market_queue.get()
-
-            # Session roll: new ticker detected
-            if bot.prev_ticker and data["ticker"] != bot.prev_ticker:
-                asyncio.create_task(bot._bg_settle(
-                    kalshi,
-                    bot.prev_ticker,
-                    shared.latest_btc,
-                    bot.prev_strike,
-                    bot.active_position
-                ))
-                bot.active_position = None
-                bot.session_fills   = 0
-                bot.session_start_time = time.time()  # New session: only accept fresh signals
-                # Note: acted_on_birth_time is NOT reset here — intentional.
-                # Prevents re-entry on the same signal in the new session.
-
-            bot.prev_ticker = data["ticker"]
-            bot.prev_strike = data["strike"]
-            await bot.on_tick(kalshi, data)
-
-        except Exception:
-            await asyncio.sleep(1)
+    # One WebSocket order book listener per exchange (V4 pattern), the candle
+    # loop, and the Kalshi loop, which runs the strategy on every book update.
+    # Settlements spawned on session roll join the same group, so on shutdown
+    # they are cancelled and awaited along with the loops instead of leaking.
+    async with asyncio.TaskGroup() as tg:
+        bot.bg_tasks = tg
+        tg.create_task(bot.log_writer())
+        for ex in exchanges.values():
+            tg.create_task(watch_exchange_loop(ex, bot))
+        tg.create_task(ohlcv_candle_loop(exchanges, shared, bot))
+        tg.create_task(kalshi_market_loop(kalshi, bot))
 
 
 if __name__ == "__main__":
+    # SIGTERM → SystemExit so atexit handlers flush the buffered CSV log
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    # uvloop's libuv event loop where available (not on Windows); stock asyncio otherwise
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())